@@ -26,7 +26,7 @@ clean () {
 
 tty=$(tty) || tty=/dev/console
 
-export SUBIQUITY_REPLAY_TIMESCALE=100
+export SUBIQUITY_REPLAY_TIMESCALE=${SUBIQUITY_REPLAY_TIMESCALE:-1000}
 for answers in examples/answers*.yaml; do
     clean
     config=$(sed -n 's/^#machine-config: \(.*\)/\1/p' $answers || true)
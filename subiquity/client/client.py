@@ -270,11 +270,15 @@ class SubiquityClient(TuiApplication):
                 p('\x08 \n')
 
         async def _connect():
+            # The server is usually up within a fraction of a second, so
+            # start by retrying quickly and back off to once a second.
+            delay = 0.1
             while True:
                 try:
                     return await self.client.meta.status.GET()
                 except aiohttp.ClientError:
-                    await asyncio.sleep(1)
+                    await asyncio.sleep(delay)
+                    delay = min(delay * 2, 1.0)
 
         status = await spinning_wait("connecting", _connect())
         journald_listen(
@@ -101,6 +101,18 @@ def main():
     logger.info("Starting Subiquity server revision {}".format(version))
     logger.info("Arguments passed: {}".format(sys.argv))
 
+    # The server spends its time waiting on sockets, udev and
+    # subprocesses, which uvloop handles with much less overhead than the
+    # default event loop. It must be installed before the server creates
+    # its loop.
+    try:
+        import uvloop
+    except ImportError:
+        logger.debug("uvloop not available, using default event loop")
+    else:
+        uvloop.install()
+        logger.debug("using uvloop event loop")
+
     server = SubiquityServer(opts, block_log_dir)
 
     server.note_file_for_apport(
@@ -96,15 +96,16 @@ def _make_handler(controller, definition, implementation, serializer):
             definition.__qualname__, check_def_sig, check_impl_sig)
 
     async def handler(request):
+        body = await request.text()
         context = controller.context.child(
-            implementation.__name__, trim(await request.text()))
+            implementation.__name__, trim(body))
         with context:
             context.set('request', request)
             args = {}
             try:
                 if data_annotation is not None:
                     args[data_arg] = serializer.from_json(
-                        data_annotation, await request.text())
+                        data_annotation, body)
                 for arg, ann, default in query_args_anns:
                     if arg in request.query:
                         v = serializer.from_json(ann, request.query[arg])
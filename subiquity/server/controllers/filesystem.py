@@ -18,7 +18,8 @@ import glob
 import json
 import logging
 import os
-import select
+import platform
+import time
 from typing import Optional
 
 import pyudev
@@ -30,9 +31,6 @@ from subiquitycore.async_helpers import (
     SingleInstanceTask,
     )
 from subiquitycore.context import with_context
-from subiquitycore.utils import (
-    run_command,
-    )
 from subiquitycore.lsb_release import lsb_release
 
 from subiquity.common.apidef import API
@@ -61,6 +59,19 @@ block_discover_log = logging.getLogger('block-discover')
 # installation.
 DEFAULT_MIN_SIZE_GUIDED = 6 * (1 << 30)
 
+# How long to let a single block probe run before giving up on it. Probes
+# of machines with lots of (or misbehaving) disks can legitimately take
+# a long time, and slower architectures need longer still.
+PROBE_TIMEOUT = 90.0
+PROBE_TIMEOUT_SLOW_ARCHES = {
+    'riscv64': 180.0,
+    }
+
+
+def _write_probe_data(fpath, storage):
+    with open(fpath, 'w') as fp:
+        json.dump(storage, fp, indent=4)
+
 
 class FilesystemController(SubiquityController, FilesystemManipulator):
 
@@ -78,11 +89,16 @@ class FilesystemController(SubiquityController, FilesystemManipulator):
             name = self.opts.bootloader.upper()
             self.model.bootloader = getattr(Bootloader, name)
         self._monitor = None
+        self._udev_pending = asyncio.Event()
+        self._udev_task = None
         self._errors = {}
+        self._probe_timeout = PROBE_TIMEOUT_SLOW_ARCHES.get(
+            platform.machine(), PROBE_TIMEOUT)
         self._probe_once_task = SingleInstanceTask(
             self._probe_once, propagate_errors=False)
         self._probe_task = SingleInstanceTask(
             self._probe, propagate_errors=False)
+        self._probe_done = asyncio.Event()
 
     def load_autoinstall_data(self, data):
         log.debug("load_autoinstall_data %s", data)
@@ -101,6 +117,9 @@ class FilesystemController(SubiquityController, FilesystemManipulator):
     def configured(self):
         super().configured()
         self.stop_listening_udev()
+        if self._udev_task is not None:
+            self._udev_task.cancel()
+            self._udev_task = None
 
     @with_context()
     async def apply_autoinstall_config(self, context=None):
@@ -147,7 +166,7 @@ class FilesystemController(SubiquityController, FilesystemManipulator):
         while self.model._one(type='lvm_volgroup', name=vg_name) is not None:
             i += 1
             vg_name = 'ubuntu-vg-{}'.format(i)
-        spec = dict(name=vg_name, devices=set([part]))
+        spec = dict(name=vg_name, devices={part})
         if lvm_options and lvm_options['encrypt']:
             spec['password'] = lvm_options['luks_options']['password']
         vg = self.create_volgroup(spec)
@@ -176,10 +195,13 @@ class FilesystemController(SubiquityController, FilesystemManipulator):
                 ))
 
     async def _probe_response(self, wait, resp_cls):
-        if self._probe_task.task is None or not self._probe_task.task.done():
+        if not self._probe_done.is_set():
             if wait:
+                # Awaiting the start task first means a failure to set up
+                # udev monitoring reaches the caller instead of leaving it
+                # waiting for a probe that never runs.
                 await self._start_task
-                await self._probe_task.wait()
+                await self._probe_done.wait()
             else:
                 return resp_cls(status=ProbeStatus.PROBING)
         if True in self._errors:
@@ -270,8 +292,11 @@ class FilesystemController(SubiquityController, FilesystemManipulator):
         storage = await run_in_thread(
             self.app.prober.get_storage, probe_types)
         fpath = os.path.join(self.app.block_log_dir, fname)
-        with open(fpath, 'w') as fp:
-            json.dump(storage, fp, indent=4)
+        # The probe data can be large on machines with many disks, so
+        # keep serializing it off the event loop. It has to be written and
+        # registered before load_probe_data, which both modifies storage
+        # and may fail in a way we want the probe data attached for.
+        await run_in_thread(_write_probe_data, fpath, storage)
         self.app.note_file_for_apport(key, fpath)
         self.model.load_probe_data(storage)
 
@@ -282,13 +307,15 @@ class FilesystemController(SubiquityController, FilesystemManipulator):
                 (False, ErrorReportKind.BLOCK_PROBE_FAIL),
                 (True,  ErrorReportKind.DISK_PROBE_FAIL),
                 ]:
+            start = time.monotonic()
             try:
                 await self._probe_once_task.start(
                     context=context, restricted=restricted)
                 # We wait on the task directly here, not
                 # self._probe_once_task.wait as if _probe_once_task
                 # gets cancelled, we should be cancelled too.
-                await asyncio.wait_for(self._probe_once_task.task, 15.0)
+                await asyncio.wait_for(
+                    self._probe_once_task.task, self._probe_timeout)
             except asyncio.CancelledError:
                 # asyncio.CancelledError is a subclass of Exception in
                 # Python 3.6 (sadface)
@@ -300,6 +327,10 @@ class FilesystemController(SubiquityController, FilesystemManipulator):
                 if report is not None:
                     self._errors[restricted] = (exc, report)
                 continue
+            finally:
+                block_discover_log.info(
+                    "probe restricted=%s took %.2fs",
+                    restricted, time.monotonic() - start)
             break
 
     @with_context()
@@ -331,33 +362,60 @@ class FilesystemController(SubiquityController, FilesystemManipulator):
         self._monitor.filter_by(subsystem='block')
         self._monitor.enable_receiving()
         self.start_listening_udev()
-        await self._probe_task.start()
+        self._udev_task = schedule_task(self._udev_loop())
+        await self._restart_probe()
+
+    def _restart_probe(self):
+        # Clear the event before the new probe is scheduled so that
+        # requests made in the meantime do not see stale probe data.
+        self._probe_done.clear()
+        start = self._probe_task.start_sync()
+        self._probe_task.task.add_done_callback(self._probe_finished)
+        return start
+
+    def _probe_finished(self, task):
+        # Runs however the probe ends, so waiters are released even if
+        # _probe raises. A probe cancelled because a newer one replaced
+        # it must not mark probing as done, though.
+        if task is self._probe_task.task:
+            self._probe_done.set()
 
     def start_listening_udev(self):
-        loop = asyncio.get_event_loop()
-        loop.add_reader(self._monitor.fileno(), self._udev_event)
+        # The reader callback only flags that there is something to read;
+        # _udev_loop does the actual work.
+        self.app.aio_loop.add_reader(
+            self._monitor.fileno(), self._udev_pending.set)
 
     def stop_listening_udev(self):
-        loop = asyncio.get_event_loop()
-        loop.remove_reader(self._monitor.fileno())
-
-    def _udev_event(self):
-        cp = run_command(['udevadm', 'settle', '-t', '0'])
-        if cp.returncode != 0:
-            log.debug("waiting 0.1 to let udev event queue settle")
-            self.stop_listening_udev()
-            loop = asyncio.get_event_loop()
-            loop.call_later(0.1, self.start_listening_udev)
-            return
-        # Drain the udev events in the queue -- if we stopped listening to
-        # allow udev to settle, it's good bet there is more than one event to
-        # process and we don't want to kick off a full block probe for each
-        # one.  It's a touch unfortunate that pyudev doesn't have a
-        # non-blocking read so we resort to select().
-        while select.select([self._monitor.fileno()], [], [], 0)[0]:
-            action, dev = self._monitor.receive_device()
-            log.debug("_udev_event %s %s", action, dev)
-        self._probe_task.start_sync()
+        self.app.aio_loop.remove_reader(self._monitor.fileno())
+
+    def _drain_udev_events(self):
+        # poll(0) never blocks and returns None once the queue is empty.
+        # It still makes a poll(2) call for each event internally, so this
+        # is no cheaper than select() followed by receive_device(); it is
+        # just simpler.
+        poll = self._monitor.poll
+        while True:
+            dev = poll(0)
+            if dev is None:
+                break
+            log.debug("_udev_event %s %s", dev.action, dev)
+
+    async def _udev_loop(self):
+        while True:
+            await self._udev_pending.wait()
+            # Events tend to arrive in bursts (e.g. when an enclosure with
+            # several disks is attached) and we don't want to kick off a
+            # full block probe for each one, so keep draining the queue
+            # until things have been quiet for a short while.
+            while True:
+                self._udev_pending.clear()
+                self._drain_udev_events()
+                try:
+                    await asyncio.wait_for(self._udev_pending.wait(), 0.05)
+                except asyncio.TimeoutError:
+                    break
+            self._restart_probe()
 
     def make_autoinstall(self):
         rendered = self.model.render()
@@ -79,6 +79,10 @@ class InstallController(SubiquityController):
         self.unattended_upgrades_proc = None
         self.unattended_upgrades_ctx = None
         self._event_syslog_id = 'curtin_event.%s' % (os.getpid(),)
+        self._logged_command_prefix = [
+            'systemd-cat', '--level-prefix=false',
+            '--identifier=' + app.log_syslog_id,
+            ]
         self.tb_extractor = TracebackExtractor()
         self.curtin_event_contexts = {}
 
@@ -94,8 +98,7 @@ class InstallController(SubiquityController):
         return os.path.join(self.model.target, *path)
 
     def logged_command(self, cmd):
-        return ['systemd-cat', '--level-prefix=false',
-                '--identifier=' + self.app.log_syslog_id] + cmd
+        return self._logged_command_prefix + cmd
 
     def curtin_event(self, event):
         e = {
@@ -172,15 +175,14 @@ class InstallController(SubiquityController):
 
     @with_context(description="umounting /target dir")
     async def unmount_target(self, *, context, target):
-        cmd = [
+        if self.app.opts.dry_run:
+            await asyncio.sleep(0.2/self.app.scale_factor)
+            return
+        await arun_command([
             sys.executable, '-m', 'curtin', 'unmount',
             '-t', target,
-            ]
-        if self.app.opts.dry_run:
-            cmd = ['sleep', str(0.2/self.app.scale_factor)]
-        await arun_command(cmd)
-        if not self.app.opts.dry_run:
-            shutil.rmtree(target)
+            ])
+        shutil.rmtree(target)
 
     @with_context(
         description="installing system", level="INFO", childlevel="DEBUG")
@@ -282,30 +284,30 @@ class InstallController(SubiquityController):
         description="installing {package}")
     async def install_package(self, *, context, package):
         if self.app.opts.dry_run:
-            cmd = ["sleep", str(2/self.app.scale_factor)]
-        else:
-            cmd = [
-                sys.executable, "-m", "curtin", "system-install", "-t",
-                "/target",
-                "--", package,
-                ]
+            await asyncio.sleep(2/self.app.scale_factor)
+            return
+        cmd = [
+            sys.executable, "-m", "curtin", "system-install", "-t",
+            "/target",
+            "--", package,
+            ]
         await arun_command(self.logged_command(cmd), check=True)
 
     @with_context(description="restoring apt configuration")
     async def restore_apt_config(self, context):
         if self.app.opts.dry_run:
-            cmds = [["sleep", str(1/self.app.scale_factor)]]
+            await asyncio.sleep(1/self.app.scale_factor)
+            return
+        cmds = [
+            ["umount", self.tpath('etc/apt')],
+            ]
+        if self.model.network.has_network:
+            cmds.append([
+                sys.executable, "-m", "curtin", "in-target", "-t",
+                "/target", "--", "apt-get", "update",
+                ])
         else:
-            cmds = [
-                ["umount", self.tpath('etc/apt')],
-                ]
-            if self.model.network.has_network:
-                cmds.append([
-                    sys.executable, "-m", "curtin", "in-target", "-t",
-                    "/target", "--", "apt-get", "update",
-                    ])
-            else:
-                cmds.append(["umount", self.tpath('var/lib/apt/lists')])
+            cmds.append(["umount", self.tpath('var/lib/apt/lists')])
         for cmd in cmds:
             await arun_command(self.logged_command(cmd), check=True)
 
@@ -13,6 +13,7 @@
 # You should have received a copy of the GNU Affero General Public License
 # along with this program.  If not, see <http://www.gnu.org/licenses/>.
 
+import asyncio
 import logging
 from typing import Dict, Optional
 import os
@@ -197,13 +198,14 @@ class KeyboardController(SubiquityController):
         os.makedirs(os.path.dirname(path), exist_ok=True)
         with open(path, 'w') as fp:
             fp.write(self.model.render_config_file())
+        if self.opts.dry_run:
+            scale = os.environ.get('SUBIQUITY_REPLAY_TIMESCALE', "1")
+            await asyncio.sleep(1/float(scale))
+            return
         cmds = [
             ['setupcon', '--save', '--force', '--keyboard-only'],
             ['/snap/bin/subiquity.subiquity-loadkeys'],
             ]
-        if self.opts.dry_run:
-            scale = os.environ.get('SUBIQUITY_REPLAY_TIMESCALE', "1")
-            cmds = [['sleep', str(1/float(scale))]]
         for cmd in cmds:
             await arun_command(cmd)
 
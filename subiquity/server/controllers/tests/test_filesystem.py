@@ -0,0 +1,150 @@
+# Copyright 2021 Canonical, Ltd.
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as
+# published by the Free Software Foundation, either version 3 of the
+# License, or (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+import asyncio
+import unittest
+from unittest import mock
+
+from subiquitycore.async_helpers import SingleInstanceTask
+
+from subiquity.common.types import StorageResponse
+from subiquity.server.controller import SubiquityController
+from subiquity.server.controllers.filesystem import FilesystemController
+
+
+class TestProbeCompletion(unittest.TestCase):
+
+    def setUp(self):
+        self.loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(self.loop)
+        self.addCleanup(self.loop.close)
+        self.addCleanup(asyncio.set_event_loop, None)
+
+    def make_controller(self, probe):
+        c = object.__new__(FilesystemController)
+        c._errors = {}
+        c._probe_done = asyncio.Event()
+        c._probe_task = SingleInstanceTask(probe, propagate_errors=False)
+        return c
+
+    def run_coro(self, coro):
+        return self.loop.run_until_complete(asyncio.wait_for(coro, 5))
+
+    def test_failed_probe_releases_waiters(self):
+        async def probe():
+            raise Exception("probe failed")
+
+        async def t():
+            c = self.make_controller(probe)
+            c._restart_probe()
+            await c._probe_done.wait()
+        self.run_coro(t())
+
+    def test_superseded_probe_does_not_set_done(self):
+        release = asyncio.Event()
+
+        async def probe():
+            await release.wait()
+
+        async def t():
+            c = self.make_controller(probe)
+            c._restart_probe()
+            first = c._probe_task.task
+            await asyncio.sleep(0)
+            c._restart_probe()
+            second = c._probe_task.task
+            while not first.done():
+                await asyncio.sleep(0)
+            self.assertTrue(first.cancelled())
+            self.assertFalse(c._probe_done.is_set())
+            release.set()
+            await second
+            await c._probe_done.wait()
+        self.run_coro(t())
+
+    def test_start_failure_reaches_waiting_caller(self):
+        class StartFailed(Exception):
+            pass
+
+        async def start():
+            raise StartFailed()
+
+        async def t():
+            c = self.make_controller(mock.Mock())
+            c._start_task = asyncio.ensure_future(start())
+            with self.assertRaises(StartFailed):
+                await c._probe_response(True, StorageResponse)
+        self.run_coro(t())
+
+
+class FakeMonitor:
+
+    def __init__(self, count):
+        self.events = [mock.Mock(action='add') for i in range(count)]
+
+    def fileno(self):
+        return 42
+
+    def poll(self, timeout=None):
+        if self.events:
+            return self.events.pop(0)
+        return None
+
+
+class TestUdevDebounce(unittest.TestCase):
+
+    def setUp(self):
+        self.loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(self.loop)
+        self.addCleanup(self.loop.close)
+        self.addCleanup(asyncio.set_event_loop, None)
+
+    def make_controller(self, monitor):
+        c = object.__new__(FilesystemController)
+        c.app = mock.Mock()
+        c._monitor = monitor
+        c._udev_pending = asyncio.Event()
+        c._restart_probe = mock.Mock()
+        return c
+
+    def test_burst_restarts_probe_once(self):
+        monitor = FakeMonitor(5)
+        c = self.make_controller(monitor)
+
+        async def t():
+            task = asyncio.ensure_future(c._udev_loop())
+            for i in range(3):
+                c._udev_pending.set()
+                await asyncio.sleep(0.01)
+            await asyncio.sleep(0.2)
+            task.cancel()
+        self.loop.run_until_complete(t())
+        self.assertEqual(monitor.events, [])
+        c._restart_probe.assert_called_once_with()
+
+    def test_configured_stops_udev(self):
+        c = self.make_controller(FakeMonitor(0))
+
+        async def t():
+            task = c._udev_task = asyncio.ensure_future(c._udev_loop())
+            await asyncio.sleep(0)
+            with mock.patch.object(SubiquityController, 'configured'):
+                c.configured()
+            await asyncio.sleep(0)
+            return task
+        task = self.loop.run_until_complete(t())
+        self.assertTrue(task.cancelled())
+        self.assertIsNone(c._udev_task)
+        c.app.aio_loop.remove_reader.assert_called_once_with(42)
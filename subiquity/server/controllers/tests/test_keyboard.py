@@ -41,7 +41,7 @@ class TestSubiquityModel(unittest.TestCase):
         policy.set_child_watcher(watcher)
 
         async def t():
-            os.environ['SUBIQUITY_REPLAY_TIMESCALE'] = '100'
+            os.environ['SUBIQUITY_REPLAY_TIMESCALE'] = '1000'
             with tempfile.TemporaryDirectory() as tmpdir:
                 new_setting = KeyboardSetting('fr', 'azerty')
                 model = KeyboardModel(tmpdir)
@@ -46,6 +46,9 @@ SSH_IMPORT_MAXLEN = 256 + 3  # account for lp: or gh:
 USERNAME_MAXLEN = 32
 USERNAME_REGEX = r'[a-z_][a-z0-9_-]*'
 
+HOSTNAME_RE = re.compile(HOSTNAME_REGEX)
+USERNAME_RE = re.compile(USERNAME_REGEX)
+
 
 class RealnameEditor(StringEditor, WantsToKnowFormField):
     def valid_char(self, ch):
@@ -109,7 +112,7 @@ class IdentityForm(Form):
                 "Server name too long, must be less than {limit}"
                 ).format(limit=HOSTNAME_MAXLEN)
 
-        if not re.match(HOSTNAME_REGEX, self.hostname.value):
+        if not HOSTNAME_RE.match(self.hostname.value):
             return _(
                 "Hostname must match HOSTNAME_REGEX: " + HOSTNAME_REGEX)
 
@@ -123,7 +126,7 @@ class IdentityForm(Form):
                 "Username too long, must be less than {limit}"
                 ).format(limit=USERNAME_MAXLEN)
 
-        if not re.match(r'[a-z_][a-z0-9_-]*', username):
+        if not USERNAME_RE.match(username):
             return _(
                 "Username must match USERNAME_REGEX: " + USERNAME_REGEX)
 
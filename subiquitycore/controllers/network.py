@@ -289,8 +289,7 @@ class BaseNetworkController(BaseController):
                     self.apply_error(stage)
 
             if self.opts.dry_run:
-                delay = 1/self.app.scale_factor
-                await arun_command(['sleep', str(delay)])
+                await asyncio.sleep(1/self.app.scale_factor)
                 if os.path.exists('/lib/netplan/generate'):
                     # If netplan appears to be installed, run generate to
                     # at least test that what we wrote is acceptable to
@@ -5,9 +5,15 @@ import tempfile
 _DEF_PERMS = 0o644
 
 
-def write_file(filename, content, mode=None, omode="wb", copy_mode=False):
+def write_file(filename, content, mode=None, omode="wb", copy_mode=False,
+               atomic=True):
     """Atomically write filename.
     open filename in mode 'omode', write content, chmod to 'mode'.
+
+    If atomic is False, filename is truncated and written in place, which
+    avoids creating and renaming a temporary file. Only do this when
+    nothing can be reading filename at the same time, and note that a
+    symlink at filename is followed rather than replaced.
     """
     if mode is None:
         mode = _DEF_PERMS
@@ -18,6 +24,13 @@ def write_file(filename, content, mode=None, omode="wb", copy_mode=False):
         except OSError:
             pass
 
+    if not atomic:
+        fd = os.open(filename, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, mode)
+        with os.fdopen(fd, omode) as fp:
+            os.fchmod(fd, mode)
+            fp.write(content)
+        return
+
     tf = None
     try:
         tf = tempfile.NamedTemporaryFile(dir=os.path.dirname(filename),
@@ -1,4 +1,5 @@
 # This file is part of subiquity. See LICENSE file for license information.
+import functools
 import shlex
 
 LSB_RELEASE_FILE = "/etc/lsb-release"
@@ -9,7 +10,12 @@ def lsb_release(path=None):
     keys are lower case with DISTRIB_ prefix removed."""
     if path is None:
         path = LSB_RELEASE_FILE
+    # The parsed file is cached; hand out a copy so callers can modify it.
+    return dict(_read_lsb_release(path))
 
+
+@functools.lru_cache(maxsize=None)
+def _read_lsb_release(path):
     ret = {}
     try:
         with open(path, "r") as fp:
@@ -20,16 +20,34 @@ import inspect
 class MessageHub:
 
     def __init__(self):
+        # Maps channel to a tuple of (method, args, is_async). The tuple is
+        # replaced rather than mutated on subscribe, so broadcasts iterate
+        # over a stable snapshot.
         self.subscriptions = {}
 
     def subscribe(self, channel, method, *args):
-        self.subscriptions.setdefault(channel, []).append((method, args))
+        is_async = asyncio.iscoroutinefunction(method)
+        self.subscriptions[channel] = self.subscriptions.get(channel, ()) + (
+            (method, args, is_async),)
 
     async def abroadcast(self, channel):
-        for m, args in self.subscriptions.get(channel, []):
-            v = m(*args)
-            if inspect.iscoroutine(v):
-                await v
+        for m, args, is_async in self.subscriptions.get(channel, ()):
+            if is_async:
+                await m(*args)
+            else:
+                # A plain callable can still return an awaitable (e.g. a
+                # functools.partial or lambda wrapping a coroutine
+                # function), so await that too.
+                r = m(*args)
+                if inspect.isawaitable(r):
+                    await r
 
     def broadcast(self, channel):
-        return asyncio.get_event_loop().create_task(self.abroadcast(channel))
+        loop = asyncio.get_event_loop()
+        if channel not in self.subscriptions:
+            # Nothing to run, so skip creating a coroutine and a task but
+            # still hand back something callers can await.
+            fut = loop.create_future()
+            fut.set_result(None)
+            return fut
+        return loop.create_task(self.abroadcast(channel))
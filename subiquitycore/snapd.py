@@ -62,14 +62,10 @@ class SnapdConnection:
         with open(os.path.join(dropin_dir, 'snap_proxy.conf'), 'w') as fp:
             fp.write(proxy.proxy_systemd_dropin())
         if self.root == '/':
-            cmds = [
-                ['systemctl', 'daemon-reload'],
-                ['systemctl', 'restart', 'snapd.service'],
-                ]
+            run_command(['systemctl', 'daemon-reload'])
+            run_command(['systemctl', 'restart', 'snapd.service'])
         else:
-            cmds = [['sleep', '2']]
-        for cmd in cmds:
-            run_command(cmd)
+            time.sleep(2)
 
 
 class _FakeFileResponse:
@@ -0,0 +1,40 @@
+# Copyright 2021 Canonical, Ltd.
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as
+# published by the Free Software Foundation, either version 3 of the
+# License, or (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+import os
+import stat
+
+from subiquitycore.file_util import write_file
+from subiquitycore.tests import SubiTestCase
+
+
+class TestWriteFile(SubiTestCase):
+
+    def test_non_atomic_truncates(self):
+        path = self.tmp_path('file')
+        with open(path, 'w') as fp:
+            fp.write('a much longer existing content\n')
+        write_file(path, 'short\n', omode='w', atomic=False)
+        with open(path) as fp:
+            self.assertEqual(fp.read(), 'short\n')
+
+    def test_non_atomic_mode_ignores_umask(self):
+        path = self.tmp_path('file')
+        old_umask = os.umask(0o077)
+        try:
+            write_file(path, 'content', mode=0o644, omode='w', atomic=False)
+        finally:
+            os.umask(old_umask)
+        self.assertEqual(stat.S_IMODE(os.stat(path).st_mode), 0o644)
@@ -0,0 +1,79 @@
+# Copyright 2021 Canonical, Ltd.
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as
+# published by the Free Software Foundation, either version 3 of the
+# License, or (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+import asyncio
+
+from subiquitycore.pubsub import MessageHub
+from subiquitycore.tests import SubiTestCase
+
+
+class TestMessageHub(SubiTestCase):
+
+    def setUp(self):
+        super().setUp()
+        self.loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(self.loop)
+        self.addCleanup(self.loop.close)
+        self.addCleanup(asyncio.set_event_loop, None)
+        self.hub = MessageHub()
+
+    def run_coro(self, coro):
+        return self.loop.run_until_complete(coro)
+
+    def test_abroadcast_sync_and_async(self):
+        calls = []
+
+        def sync_cb(arg):
+            calls.append(('sync', arg))
+
+        async def async_cb(arg):
+            await asyncio.sleep(0)
+            calls.append(('async', arg))
+
+        self.hub.subscribe('chan', sync_cb, 1)
+        self.hub.subscribe('chan', async_cb, 2)
+        self.hub.subscribe('other', sync_cb, 3)
+
+        self.run_coro(self.hub.abroadcast('chan'))
+        self.assertEqual(calls, [('sync', 1), ('async', 2)])
+
+    def test_abroadcast_awaits_coroutine_from_sync_callable(self):
+        calls = []
+
+        async def async_cb(arg):
+            await asyncio.sleep(0)
+            calls.append(arg)
+
+        self.hub.subscribe('chan', lambda arg: async_cb(arg), 1)
+
+        self.run_coro(self.hub.abroadcast('chan'))
+        self.assertEqual(calls, [1])
+
+    def test_abroadcast_no_subscribers(self):
+        calls = []
+        self.hub.subscribe('other', calls.append, 1)
+        self.run_coro(self.hub.abroadcast('chan'))
+        self.assertEqual(calls, [])
+
+    def test_broadcast_no_subscribers(self):
+        fut = self.hub.broadcast('chan')
+        self.assertTrue(fut.done())
+        self.run_coro(fut)
+
+    def test_broadcast_runs_subscribers(self):
+        calls = []
+        self.hub.subscribe('chan', calls.append, 1)
+        self.run_coro(self.hub.broadcast('chan'))
+        self.assertEqual(calls, [1])
@@ -332,7 +332,7 @@ class AbstractTable(WidgetWrap):
 
         super().__init__(self._make(self.table_rows))
         self._last_size = None
-        self.group = set([self])
+        self.group = {self}
 
     def bind(self, other_table):
         """Bind two tables such that they will use the same column widths.
@@ -216,7 +216,7 @@ class Color:
     pass
 
 
-_disable_everything_map = {k: 'info_minor' for k in STYLE_NAMES | set([None])}
+_disable_everything_map = {k: 'info_minor' for k in STYLE_NAMES | {None}}
 
 
 def disabled(w):
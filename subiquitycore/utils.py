@@ -14,24 +14,31 @@
 # along with this program.  If not, see <http://www.gnu.org/licenses/>.
 
 import asyncio
-import crypt
+import base64
 import logging
 import os
-import random
+import secrets
 import subprocess
 
 log = logging.getLogger("subiquitycore.utils")
 
 
 def _clean_env(env):
+    # Build the child environment in one pass rather than copying and
+    # then mutating. os.environ is not snapshotted once because the proxy
+    # and locale controllers change it at runtime.
     if env is None:
-        env = os.environ.copy()
-    else:
-        env = env.copy()
-    # Do we always want to do this?
-    env['LC_ALL'] = 'C'
-    # Maaaybe want to remove SNAP here too.
-    return env
+        env = os.environ
+    # Do we always want to force LC_ALL=C? Maaaybe want to remove SNAP
+    # here too.
+    return {**env, 'LC_ALL': 'C'}
+
+
+def _prepare_command(name, cmd, env):
+    # Shared by the subprocess wrappers below: log the call and build the
+    # child environment.
+    log.debug("%s called: %s", name, cmd)
+    return _clean_env(env)
 
 
 def run_command(cmd, *, input=None, stdout=subprocess.PIPE,
@@ -45,15 +52,15 @@ def run_command(cmd, *, input=None, stdout=subprocess.PIPE,
         kw['stdin'] = subprocess.DEVNULL
     else:
         input = input.encode(encoding)
-    log.debug("run_command called: %s", cmd)
+    env = _prepare_command("run_command", cmd, env)
     try:
         cp = subprocess.run(cmd, input=input, stdout=stdout, stderr=stderr,
-                            env=_clean_env(env), **kw)
+                            env=env, **kw)
         if encoding:
             if isinstance(cp.stdout, bytes):
-                cp.stdout = cp.stdout.decode(encoding)
+                cp.stdout = cp.stdout.decode(encoding, errors)
             if isinstance(cp.stderr, bytes):
-                cp.stderr = cp.stderr.decode(encoding)
+                cp.stderr = cp.stderr.decode(encoding, errors)
     except subprocess.CalledProcessError as e:
         log.debug("run_command %s", str(e))
         raise
@@ -71,15 +78,15 @@ async def arun_command(cmd, *, stdout=subprocess.PIPE, stderr=subprocess.PIPE,
     else:
         kw['stdin'] = subprocess.PIPE
         input = input.encode(encoding)
-    log.debug("arun_command called: %s", cmd)
+    env = _prepare_command("arun_command", cmd, env)
     proc = await asyncio.create_subprocess_exec(
-        *cmd, stdout=stdout, stderr=stderr, env=_clean_env(env), **kw)
+        *cmd, stdout=stdout, stderr=stderr, env=env, **kw)
     stdout, stderr = await proc.communicate(input=input)
     if encoding:
         if stdout is not None:
-            stdout = stdout.decode(encoding)
+            stdout = stdout.decode(encoding, errors)
         if stderr is not None:
-            stderr = stderr.decode(encoding)
+            stderr = stderr.decode(encoding, errors)
     log.debug("arun_command %s exited with code %s", cmd, proc.returncode)
     if check and proc.returncode != 0:
         raise subprocess.CalledProcessError(proc.returncode, cmd)
@@ -91,10 +98,9 @@ async def arun_command(cmd, *, stdout=subprocess.PIPE, stderr=subprocess.PIPE,
 async def astart_command(cmd, *, stdout=subprocess.PIPE,
                          stderr=subprocess.PIPE, stdin=subprocess.DEVNULL,
                          env=None, **kw):
-    log.debug("astart_command called: %s", cmd)
+    env = _prepare_command("astart_command", cmd, env)
     return await asyncio.create_subprocess_exec(
-        *cmd, stdout=stdout, stderr=stderr,
-        env=_clean_env(env), **kw)
+        *cmd, stdout=stdout, stderr=stderr, env=env, **kw)
 
 
 def start_command(cmd, *, stdin=subprocess.DEVNULL, stdout=subprocess.PIPE,
@@ -104,25 +110,29 @@ def start_command(cmd, *, stdin=subprocess.DEVNULL, stdout=subprocess.PIPE,
 
     We never ever want a subprocess to inherit our file descriptors!
     """
-    log.debug('start_command called: %s', cmd)
+    env = _prepare_command("start_command", cmd, env)
     return subprocess.Popen(cmd, stdin=stdin, stdout=stdout, stderr=stderr,
-                            env=_clean_env(env), **kw)
+                            env=env, **kw)
+
+
+# encryption algo - id pairs for crypt()
+_CRYPT_ALGOS = {'SHA-512': '$6$', 'SHA-256': '$5$', 'MD5': '$1$', 'DES': ''}
 
 
 # FIXME: replace with passlib and update package deps
 def crypt_password(passwd, algo='SHA-512'):
-    # encryption algo - id pairs for crypt()
-    algos = {'SHA-512': '$6$', 'SHA-256': '$5$', 'MD5': '$1$', 'DES': ''}
-    if algo not in algos:
-        raise Exception('Invalid algo({}), must be one of: {}. '.format(
-            algo, ','.join(algos.keys())))
+    # crypt is only needed here, so avoid loading it for every importer
+    # of this module.
+    import crypt
+    if algo not in _CRYPT_ALGOS:
+        raise ValueError('Invalid algo({}), must be one of: {}. '.format(
+            algo, ','.join(_CRYPT_ALGOS.keys())))
 
-    salt_set = ('abcdefghijklmnopqrstuvwxyz'
-                'ABCDEFGHIJKLMNOPQRSTUVWXYZ'
-                '0123456789./')
-    salt = 16 * ' '
-    salt = ''.join([random.choice(salt_set) for c in salt])
-    return crypt.crypt(passwd, algos[algo] + salt)
+    # 12 random bytes base64-encode to exactly 16 characters. crypt's salt
+    # alphabet is the base64 one with '.' in place of '+'.
+    salt = base64.b64encode(secrets.token_bytes(12)).decode('ascii')
+    salt = salt.replace('+', '.')
+    return crypt.crypt(passwd, _CRYPT_ALGOS[algo] + salt)
 
 
 def disable_console_conf():
@@ -136,8 +146,9 @@ def disable_console_conf():
 def disable_subiquity():
     """ Stop subiquity service; which also restores getty service """
     log.info('disabling subiquity service')
-    run_command(["mkdir", "-p", "/run/subiquity"])
-    run_command(["touch", "/run/subiquity/complete"])
+    os.makedirs("/run/subiquity", exist_ok=True)
+    with open("/run/subiquity/complete", "a"):
+        pass
     run_command(["systemctl", "start", "--no-block", "getty@tty1.service"])
     run_command(["systemctl", "stop", "--no-block",
                  "snap.subiquity.subiquity-service.service",